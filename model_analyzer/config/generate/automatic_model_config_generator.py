@@ -103,15 +103,13 @@ def _step(self) -> None:
         self._step_max_batch_size()
 
         if self._done_walking_max_batch_size():
+            self._update_saturation()
             self._reset_max_batch_size()
             self._step_instance_count()
 
     def _step_max_batch_size(self) -> None:
         self._curr_max_batch_size *= 2
-
-        last_max_throughput = self._get_last_results_max_throughput()
-        if last_max_throughput:
-            self._curr_max_batch_size_throughputs.append(last_max_throughput)
+        self._update_max_batch_size_throughput()
 
     def _step_instance_count(self) -> None:
         self._curr_instance_count += 1
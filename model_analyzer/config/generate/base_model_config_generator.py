@@ -17,7 +17,7 @@
 import abc
 import logging
 from copy import deepcopy
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Sequence
 
 from model_analyzer.config.generate.model_variant_name_manager import (
     ModelVariantNameManager,
@@ -69,23 +69,36 @@ def __init__(
         self._model_variant_name_manager = model_variant_name_manager
         self._base_model = model
         self._base_model_name = model.model_name()
-        self._remote_mode = config.triton_launch_mode == "remote"
         self._c_api_mode = config.triton_launch_mode == "c_api"
         self._cpu_only = model.cpu_only()
         self._default_only = default_only
         self._early_exit_enable = early_exit_enable
         self._model_name_index = 0
-        self._generator_started = False
+        # Whether this generator is done, only updated after each _step.
+        # The first config is always generated
+        self._done = False
         self._max_batch_size_warning_printed = False
-        self._last_results: List[Optional[RunConfigMeasurement]] = []
-        # Contains the max throughput from each provided list of measurements
-        # since the last time we stepped max_batch_size
+        # Only the max throughput of the last results is needed, so the
+        # measurements themselves are not held onto
+        self._last_results_max_throughput: Optional[float] = None
+        # The highest max throughput from the provided lists of measurements
+        # since the last time we stepped max_batch_size, and whether the most
+        # recent one was higher than all of those before it
         #
-        self._curr_max_batch_size_throughputs: List[float] = []
+        self._curr_max_batch_size_max_throughput = float("-inf")
+        self._curr_max_batch_size_throughput_increased = True
+        # The best max throughput of all finished max_batch_size walks, and
+        # how many walks in a row have failed to meaningfully improve on it
+        #
+        self._saturation_threshold = config.run_config_search_saturation_threshold
+        self._saturation_window = config.run_config_search_saturation_window
+        self._best_max_batch_size_max_throughput = float("-inf")
+        self._num_saturated_max_batch_size_walks = 0
+        self._throughput_saturated = False
 
     def _is_done(self) -> bool:
         """Returns true if this generator is done generating configs"""
-        return self._generator_started and (self._default_only or self._done_walking())
+        return self._default_only or self._throughput_saturated or self._done_walking()
 
     def get_configs(self) -> Generator[ModelConfigVariant, None, None]:
         """
@@ -94,17 +107,15 @@ def get_configs(self) -> Generator[ModelConfigVariant, None, None]:
         ModelConfig
             The next ModelConfig generated by this class
         """
-        while True:
-            if self._is_done():
-                break
+        get_next_model_config_variant = self._get_next_model_config_variant
 
-            self._generator_started = True
-            config = self._get_next_model_config_variant()
-            yield (config)
+        while not self._done:
+            yield (get_next_model_config_variant())
             self._step()
+            self._done = self._is_done()
 
     def set_last_results(
-        self, measurements: List[Optional[RunConfigMeasurement]]
+        self, measurements: Sequence[Optional[RunConfigMeasurement]]
     ) -> None:
         """
         Given the results from the last ModelConfig, make decisions
@@ -114,7 +125,9 @@ def set_last_results(
         ----------
         measurements: List of Measurements from the last run(s)
         """
-        self._last_results = measurements
+        self._last_results_max_throughput = self._calculate_last_results_max_throughput(
+            measurements
+        )
 
     @abc.abstractmethod
     def _done_walking(self) -> bool:
@@ -133,36 +146,36 @@ def _last_results_erroneous(self) -> bool:
         return last_max_throughput is None
 
     def _last_results_increased_throughput(self) -> bool:
-        if len(self._curr_max_batch_size_throughputs) < 2:
-            return True
+        return self._curr_max_batch_size_throughput_increased
 
-        lastest_throughput = self._curr_max_batch_size_throughputs[-1]
-        return all(
-            lastest_throughput > prev_throughput
-            for prev_throughput in self._curr_max_batch_size_throughputs[:-1]
-        )
+    def _update_max_batch_size_throughput(self) -> None:
+        """
+        Records the max throughput of the last results against the
+        current max_batch_size walk
+        """
+        last_max_throughput = self._get_last_results_max_throughput()
+        if last_max_throughput:
+            self._curr_max_batch_size_throughput_increased = (
+                last_max_throughput > self._curr_max_batch_size_max_throughput
+            )
+            self._curr_max_batch_size_max_throughput = max(
+                self._curr_max_batch_size_max_throughput, last_max_throughput
+            )
 
     def _get_last_results_max_throughput(self) -> Optional[float]:
-        throughputs = [
-            m.get_non_gpu_metric_value("perf_throughput")
-            for m in self._last_results
-            if m is not None
-        ]
-        if not throughputs:
-            return None
-        else:
-            return max(throughputs)
-
-    def _make_remote_model_config_variant(self) -> ModelConfigVariant:
-        if not self._config.reload_model_disable:
-            self._client.load_model(model_name=self._base_model_name)
-        model_config = ModelConfig.create_from_triton_api(
-            self._client, self._base_model_name, self._config.client_max_retries
+        return self._last_results_max_throughput
+
+    def _calculate_last_results_max_throughput(
+        self, measurements: Sequence[Optional[RunConfigMeasurement]]
+    ) -> Optional[float]:
+        return max(
+            (
+                m.get_non_gpu_metric_value("perf_throughput")
+                for m in measurements
+                if m is not None
+            ),
+            default=None,
         )
-        if not self._config.reload_model_disable:
-            self._client.unload_model(self._base_model_name)
-
-        return ModelConfigVariant(model_config, self._base_model_name, self._cpu_only)
 
     def _make_direct_mode_model_config_variant(
         self, param_combo: Dict
@@ -193,10 +206,9 @@ def make_model_config_variant(
         model_variant_name_manager: ModelVariantNameManager
         c_api_mode: Set to true if mode is c_api
         """
-        logger_str: List[str] = []
         model_name = model.model_name()
         model_config_dict = BaseModelConfigGenerator._apply_param_combo_to_model(
-            model, param_combo, logger_str
+            model, param_combo
         )
 
         (
@@ -207,15 +219,16 @@ def make_model_config_variant(
         )
 
         if variant_found:
-            logger.info(f"Found existing model config: {variant_name}")
+            log_header = f"Found existing model config: {variant_name}"
         else:
-            logger.info(f"Creating model config: {variant_name}")
-        for str in logger_str:
-            logger.info(str)
+            log_header = f"Creating model config: {variant_name}"
+        BaseModelConfigGenerator._log_param_combo(log_header, param_combo)
         logger.info("")
 
         model_config_dict["name"] = variant_name if c_api_mode else model_name
-        model_config = ModelConfig.create_from_dictionary(model_config_dict)
+        model_config = BaseModelConfigGenerator._create_model_config(
+            model, param_combo, model_config_dict
+        )
 
         return ModelConfigVariant(model_config, variant_name, model.cpu_only())
 
@@ -241,10 +254,9 @@ def make_ensemble_model_config_variant(
         c_api_mode: Set to true if mode is c_api
 
         """
-        logger_str: List[str] = []
         model_name = model.model_name()
         model_config_dict = BaseModelConfigGenerator._apply_param_combo_to_model(
-            model, param_combo, logger_str
+            model, param_combo
         )
 
         ensemble_key = ModelVariantNameManager.make_ensemble_composing_model_key(
@@ -259,21 +271,20 @@ def make_ensemble_model_config_variant(
         )
 
         if variant_found:
-            logger.info(f"Found existing ensemble model config: {variant_name}")
+            log_header = f"Found existing ensemble model config: {variant_name}"
         else:
-            logger.info(f"Creating ensemble model config: {variant_name}")
-        for str in logger_str:
-            logger.info(str)
+            log_header = f"Creating ensemble model config: {variant_name}"
+        BaseModelConfigGenerator._log_param_combo(log_header, param_combo)
 
         model_config_dict["name"] = variant_name if c_api_mode else model_name
-        model_config = ModelConfig.create_from_dictionary(model_config_dict)
+        model_config = BaseModelConfigGenerator._create_model_config(
+            model, param_combo, model_config_dict
+        )
 
         return ModelConfigVariant(model_config, variant_name)
 
     @staticmethod
-    def _apply_param_combo_to_model(
-        model: ModelProfileSpec, param_combo: dict, logger_str: List[str]
-    ) -> dict:
+    def _apply_param_combo_to_model(model: ModelProfileSpec, param_combo: dict) -> dict:
         """
         Given a model, apply any parameters and return a model config dictionary
         """
@@ -285,16 +296,92 @@ def _apply_param_combo_to_model(
                         key, value, model_config_dict
                     )
 
-                    if value == {}:
-                        logger_str.append(f"  Enabling {key}")
-                    else:
-                        logger_str.append(f"  Setting {key} to {value}")
-
         return model_config_dict
 
+    @staticmethod
+    def _log_param_combo(log_header: str, param_combo: dict) -> None:
+        """
+        Logs the header followed by the parameters applied from the param_combo
+        as a single multi-line message
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        log_lines = [log_header]
+        if param_combo is not None:
+            log_lines.extend(
+                f"  Enabling {key}" if value == {} else f"  Setting {key} to {value}"
+                for key, value in param_combo.items()
+                if value is not None
+            )
+
+        logger.info("\n".join(log_lines))
+
+    @staticmethod
+    def _create_model_config(
+        model: ModelProfileSpec, param_combo: dict, model_config_dict: dict
+    ) -> ModelConfig:
+        """
+        Creates the ModelConfig for a model config dictionary that was made by
+        applying param_combo to the model's default config
+
+        Only the top-level fields touched by param_combo (and the name) are
+        converted to protobuf; everything else is copied from the default
+        config's protobuf
+        """
+        model_config_patch = {"name": model_config_dict["name"]}
+        if param_combo is not None:
+            for key, value in param_combo.items():
+                if value is not None:
+                    model_config_patch[key] = model_config_dict[key]
+
+        return ModelConfig.create_from_template(
+            model.get_default_config_proto(), model_config_patch
+        )
+
+    def _update_saturation(self) -> None:
+        """
+        Called at the end of each max_batch_size walk. Stops this generator
+        once the last N walks have all failed to meaningfully improve on the
+        best throughput of the walks before them
+        """
+        walk_max_throughput = self._curr_max_batch_size_max_throughput
+
+        if self._is_max_batch_size_walk_saturated(walk_max_throughput):
+            self._num_saturated_max_batch_size_walks += 1
+        else:
+            self._num_saturated_max_batch_size_walks = 0
+
+        self._best_max_batch_size_max_throughput = max(
+            self._best_max_batch_size_max_throughput, walk_max_throughput
+        )
+
+        if (
+            self._early_exit_enable
+            and self._saturation_window > 0
+            and self._num_saturated_max_batch_size_walks >= self._saturation_window
+        ):
+            logger.info(
+                f"No longer searching model configs for {self._base_model_name} because throughput has saturated"
+            )
+            self._throughput_saturated = True
+
+    def _is_max_batch_size_walk_saturated(self, walk_max_throughput: float) -> bool:
+        if self._best_max_batch_size_max_throughput == float("-inf"):
+            return False
+
+        if walk_max_throughput <= 0:
+            return True
+
+        return (
+            self._best_max_batch_size_max_throughput / walk_max_throughput
+            >= self._saturation_threshold
+        )
+
     def _reset_max_batch_size(self) -> None:
         self._max_batch_size_warning_printed = False
-        self._curr_max_batch_size_throughputs = []
+        self._curr_max_batch_size_max_throughput = float("-inf")
+        self._curr_max_batch_size_throughput_increased = True
 
     def _print_max_batch_size_plateau_warning(self) -> None:
         if not self._max_batch_size_warning_printed:
@@ -341,12 +428,20 @@ def _apply_value_to_dict(key: Any, value: Any, dict_in: Dict) -> None:
         If the key already exists in the dict and both the existing value as well
         as the new input value are dicts, only overwrite the subkeys (recursively)
         provided in the value
-        """
 
-        if type(dict_in.get(key, None)) is dict and type(value) is dict:
-            for subkey, subvalue in value.items():
-                BaseModelConfigGenerator._apply_value_to_dict(
-                    subkey, subvalue, dict_in.get(key, None)
+        This walks the nested dicts with an explicit stack rather than recursing,
+        so arbitrarily deep user-supplied parameters cannot hit the recursion limit
+        """
+        stack = [(dict_in, key, value)]
+        while stack:
+            curr_dict, curr_key, curr_value = stack.pop()
+            existing_value = curr_dict.get(curr_key, None)
+
+            if isinstance(existing_value, dict) and isinstance(curr_value, dict):
+                # Reversed so that subkeys are applied in their original order
+                stack.extend(
+                    (existing_value, subkey, subvalue)
+                    for subkey, subvalue in reversed(curr_value.items())
                 )
-        else:
-            dict_in[key] = value
+            else:
+                curr_dict[curr_key] = curr_value
@@ -116,6 +116,7 @@ def _step(self) -> None:
         self._step_max_batch_size()
 
         if self._done_walking_max_batch_size():
+            self._update_saturation()
             self._reset_max_batch_size()
             self._step_config()
 
@@ -128,10 +129,7 @@ def _step_config(self) -> None:
 
     def _step_max_batch_size(self) -> None:
         self._curr_max_batch_size_index += 1
-
-        last_max_throughput = self._get_last_results_max_throughput()
-        if last_max_throughput:
-            self._curr_max_batch_size_throughputs.append(last_max_throughput)
+        self._update_max_batch_size_throughput()
 
     def _get_next_model_config_variant(self) -> ModelConfigVariant:
         return self._configs[self._curr_config_index][self._curr_max_batch_size_index]
@@ -24,7 +24,7 @@
 from model_analyzer.triton.client.client import TritonClient
 
 from .automatic_model_config_generator import AutomaticModelConfigGenerator
-from .config_generator_interface import ConfigGeneratorInterface
+from .base_model_config_generator import BaseModelConfigGenerator
 from .manual_model_config_generator import ManualModelConfigGenerator
 from .model_profile_spec import ModelProfileSpec
 
@@ -43,7 +43,7 @@ def create_model_config_generator(
         model_variant_name_manager: ModelVariantNameManager,
         default_only: bool,
         early_exit_enable: bool,
-    ) -> ConfigGeneratorInterface:
+    ) -> BaseModelConfigGenerator:
         """
         Parameters
         ----------
@@ -64,7 +64,7 @@ def create_model_config_generator(
 
         Returns
         -------
-        A generator that implements ConfigGeneratorInterface and creates ModelConfigs
+        A BaseModelConfigGenerator that creates ModelConfigs
         """
 
         search_disabled = config.run_config_search_disable
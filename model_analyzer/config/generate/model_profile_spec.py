@@ -17,6 +17,9 @@
 from copy import deepcopy
 from typing import List
 
+from google.protobuf import json_format
+from tritonclient.grpc import model_config_pb2
+
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.config.input.objects.config_model_profile_spec import (
     ConfigModelProfileSpec,
@@ -44,13 +47,25 @@ def __init__(
         self._default_model_config = ModelConfig.create_model_config_dict(
             config, client, gpus, config.model_repository, spec.model_name()
         )
+        self._default_model_config_proto = None
 
         if spec.model_name() in config.cpu_only_composing_models:
             self._cpu_only = True
 
     def get_default_config(self) -> dict:
         """Returns the default configuration for this model"""
-        return deepcopy(self._default_model_config)
+        return ModelConfig.copy_config_dict(self._default_model_config)
+
+    def get_default_config_proto(self) -> model_config_pb2.ModelConfig:
+        """
+        Returns the default configuration for this model as a protobuf
+        message. It is shared between callers and must not be modified
+        """
+        if self._default_model_config_proto is None:
+            self._default_model_config_proto = json_format.ParseDict(
+                self._default_model_config, model_config_pb2.ModelConfig()
+            )
+        return self._default_model_config_proto
 
     def supports_batching(self) -> bool:
         """Returns True if this model supports batching. Else False"""
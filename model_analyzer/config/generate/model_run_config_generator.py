@@ -88,7 +88,7 @@ def __init__(
             self._mcg_early_exit_enable,
         )
 
-        self._curr_mc_measurements: List[Optional[RunConfigMeasurement]] = []
+        self._curr_mc_measurements: List[RunConfigMeasurement] = []
 
     def get_configs(self) -> Generator[ModelRunConfig, None, None]:
         """
@@ -97,6 +97,9 @@ def get_configs(self) -> Generator[ModelRunConfig, None, None]:
         ModelRunConfig
             The next ModelRunConfig generated by this class
         """
+        # The next ModelConfig must not be requested (e.g. prefetched) until
+        # the results of the current one have been passed to the model config
+        # generator, since they decide what it generates next
         for model_config_variant in self._mcg.get_configs():
             self._pacg = PerfAnalyzerConfigGenerator(
                 self._config,
@@ -126,7 +129,7 @@ def set_last_results(
         measurements: List of Measurements from the last run(s)
         """
         self._pacg.set_last_results(measurements)
-        self._curr_mc_measurements.extend(measurements)
+        self._curr_mc_measurements.extend(m for m in measurements if m is not None)
 
     def _set_last_results_model_config_generator(self) -> None:
         self._mcg.set_last_results(self._curr_mc_measurements)
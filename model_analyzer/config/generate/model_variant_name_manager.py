@@ -14,10 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Hashable, List, Tuple
 
 from model_analyzer.constants import DEFAULT_CONFIG_PARAMS
+from model_analyzer.triton.model.model_config import ModelConfig
 from model_analyzer.triton.model.model_config_variant import ModelConfigVariant
 
 
@@ -29,6 +29,10 @@ def __init__(self) -> None:
         # Dict of {base_model_name: current_count_integer}
         self._model_name_index: Dict[str, int] = {}
 
+        # Dict of {hashable(model_config_dict): model_config_name}
+        # Derived from _model_config_dicts and not checkpointed
+        self._model_config_names: Dict[Hashable, str] = {}
+
     @classmethod
     def from_dict(
         cls, model_variant_name_manager_dict: Dict
@@ -41,9 +45,22 @@ def from_dict(
         model_variant_name_manager._model_name_index = model_variant_name_manager_dict[
             "_model_name_index"
         ]
+        model_variant_name_manager._model_config_names = {
+            ModelVariantNameManager._make_hashable(model_config_dict): model_config_name
+            for (
+                model_config_name,
+                model_config_dict,
+            ) in model_variant_name_manager._model_config_dicts.items()
+        }
 
         return model_variant_name_manager
 
+    def to_dict(self) -> Dict:
+        return {
+            "_model_config_dicts": self._model_config_dicts,
+            "_model_name_index": self._model_name_index,
+        }
+
     @staticmethod
     def make_ensemble_composing_model_key(
         ensemble_model_config_variants: List[ModelConfigVariant],
@@ -87,12 +104,13 @@ def _get_variant_name(
         is_ensemble: bool,
         param_combo: Dict = {},
     ) -> Tuple[bool, str]:
-        model_config_dict = self._copy_and_restore_model_config_dict_name(
+        model_config_dict = self._restore_model_config_dict_name(
             model_name, config_dict
         )
+        model_config_key = self._make_hashable(model_config_dict)
 
         variant_found, model_variant_name = self._find_existing_variant(
-            model_config_dict
+            model_config_key
         )
 
         if is_ensemble:
@@ -106,29 +124,39 @@ def _get_variant_name(
             return (True, model_variant_name)
 
         model_variant_name = self._create_new_model_variant(
-            model_name, model_config_dict
+            model_name, model_config_dict, model_config_key
         )
 
         return (False, model_variant_name)
 
-    def _copy_and_restore_model_config_dict_name(
+    def _restore_model_config_dict_name(
         self, model_name: str, model_config_dict: Dict
     ) -> Dict:
-        model_config_dict_copy = deepcopy(model_config_dict)
-        model_config_dict_copy["name"] = model_name
+        # Shallow copy: the dict is only fully copied if it gets stored
+        return {**model_config_dict, "name": model_name}
 
-        return model_config_dict_copy
-
-    def _find_existing_variant(self, model_config_dict: Dict) -> Tuple[bool, str]:
-        for (
-            model_config_name,
-            model_config_variant_dict,
-        ) in self._model_config_dicts.items():
-            if model_config_dict == model_config_variant_dict:
-                return (True, model_config_name)
+    def _find_existing_variant(self, model_config_key: Hashable) -> Tuple[bool, str]:
+        if model_config_key in self._model_config_names:
+            return (True, self._model_config_names[model_config_key])
 
         return (False, "")
 
+    @staticmethod
+    def _make_hashable(value: Any) -> Hashable:
+        """
+        Converts a (nested) model config dict into a hashable value that
+        compares equal exactly when the dicts compare equal
+        """
+        if isinstance(value, dict):
+            return frozenset(
+                (key, ModelVariantNameManager._make_hashable(sub_value))
+                for key, sub_value in value.items()
+            )
+        elif isinstance(value, list):
+            return tuple(ModelVariantNameManager._make_hashable(v) for v in value)
+        else:
+            return value
+
     def _is_default_config(self, param_combo: Dict) -> bool:
         return param_combo == DEFAULT_CONFIG_PARAMS
 
@@ -136,7 +164,7 @@ def _is_ensemble_default_config(self, ensemble_dict: Dict) -> bool:
         return "_config_default" in ensemble_dict["key"]
 
     def _create_new_model_variant(
-        self, model_name: str, model_config_dict: Dict
+        self, model_name: str, model_config_dict: Dict, model_config_key: Hashable
     ) -> str:
         if model_name not in self._model_name_index:
             new_index = 0
@@ -145,6 +173,9 @@ def _create_new_model_variant(
 
         self._model_name_index[model_name] = new_index
         model_config_name = model_name + "_config_" + str(new_index)
-        self._model_config_dicts[model_config_name] = model_config_dict
+        self._model_config_dicts[model_config_name] = ModelConfig.copy_config_dict(
+            model_config_dict
+        )
+        self._model_config_names[model_config_key] = model_config_name
 
         return model_config_name
@@ -27,8 +27,10 @@
 from model_analyzer.config.input.config_utils import (
     binary_path_validator,
     file_path_validator,
+    non_negative_validator,
     objective_list_output_mapper,
     parent_path_validator,
+    positive_fraction_validator,
 )
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
@@ -92,6 +94,8 @@
     DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE,
     DEFAULT_RUN_CONFIG_SEARCH_DISABLE,
     DEFAULT_RUN_CONFIG_SEARCH_MODE,
+    DEFAULT_RUN_CONFIG_SEARCH_SATURATION_THRESHOLD,
+    DEFAULT_RUN_CONFIG_SEARCH_SATURATION_WINDOW,
     DEFAULT_SERVER_OUTPUT_FIELDS,
     DEFAULT_SKIP_DETAILED_REPORTS,
     DEFAULT_SKIP_SUMMARY_REPORTS,
@@ -935,6 +939,26 @@ def _add_run_search_configs(self):
                 description="Maximum number of steps take during the binary concurrency search.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "run_config_search_saturation_threshold",
+                flags=["--run-config-search-saturation-threshold"],
+                field_type=ConfigPrimitive(
+                    float, validator=positive_fraction_validator
+                ),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_SATURATION_THRESHOLD,
+                description="A max batch size sweep is considered saturated if the best throughput of the sweeps before it is at least this fraction of its own best throughput.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "run_config_search_saturation_window",
+                flags=["--run-config-search-saturation-window"],
+                field_type=ConfigPrimitive(int, validator=non_negative_validator),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_SATURATION_WINDOW,
+                description="Number of consecutive saturated max batch size sweeps after which brute search stops early. 0 disables this check.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "min_percentage_of_search_space",
@@ -109,6 +109,50 @@ def file_path_validator(path):
         )
 
 
+def positive_fraction_validator(value):
+    """
+    Used when a value must be a fraction in (0, 1]
+
+    Parameters
+    ----------
+    value: float
+
+    Returns
+    -------
+    ConfigStatus
+    """
+
+    if 0 < value <= 1:
+        return ConfigStatus(status=CONFIG_PARSER_SUCCESS)
+    else:
+        return ConfigStatus(
+            status=CONFIG_PARSER_FAILURE,
+            message=f"Value '{value}' must be greater than 0 and at most 1.",
+        )
+
+
+def non_negative_validator(value):
+    """
+    Used when a value must not be negative
+
+    Parameters
+    ----------
+    value: int or float
+
+    Returns
+    -------
+    ConfigStatus
+    """
+
+    if value >= 0:
+        return ConfigStatus(status=CONFIG_PARSER_SUCCESS)
+    else:
+        return ConfigStatus(
+            status=CONFIG_PARSER_FAILURE,
+            message=f"Value '{value}' must not be negative.",
+        )
+
+
 ##################
 # Output mappers #
 ##################
@@ -100,6 +100,10 @@ def _create_summary_plot_for_model(self, model_name, plots_key, num_results):
             constraints = self._constraints[GLOBAL_CONSTRAINTS_KEY]
             if plots_key in self._constraints:
                 constraints = self._constraints[plots_key]
+
+            # Add all of the results before drawing, so that each
+            # plot is only sorted and drawn once
+            updated_plots = {}
             for run_config_result in self._result_manager.top_n_results(
                 model_name=model_name, n=num_results, include_default=True
             ):
@@ -109,19 +113,24 @@ def _create_summary_plot_for_model(self, model_name, plots_key, num_results):
                             DEFAULT_CPU_MEM_PLOT.items()
                         )[0]
                         plot_config = ConfigPlot(plot_name, **plot_config_dict)
-                self._create_update_simple_plot(
+                simple_plot = self._create_update_simple_plot(
                     plots_key=plots_key,
                     plot_config=plot_config,
                     run_config_measurements=run_config_result.run_config_measurements(),
-                    constraints=constraints,
                 )
+                updated_plots[plot_config.name()] = simple_plot
+
+            for simple_plot in updated_plots.values():
+                self._draw_simple_plot(simple_plot, constraints)
 
     def _create_update_simple_plot(
-        self, plots_key, plot_config, run_config_measurements, constraints
+        self, plots_key, plot_config, run_config_measurements
     ):
         """
         Creates or updates a single simple plot, given a config name,
         some measurements, and a key to put the plot into the simple plots
+
+        The plot is not drawn, see _draw_simple_plot(). Returns the plot
         """
 
         if plots_key not in self._simple_plots:
@@ -135,19 +144,23 @@ def _create_update_simple_plot(
                 monotonic=plot_config.monotonic(),
             )
 
+        simple_plot = self._simple_plots[plots_key][plot_config.name()]
         for run_config_measurement in run_config_measurements:
-            self._simple_plots[plots_key][
-                plot_config.name()
-            ].add_run_config_measurement(
+            simple_plot.add_run_config_measurement(
                 label=run_config_measurement.model_variants_name(),
                 run_config_measurement=run_config_measurement,
             )
 
+        return simple_plot
+
+    def _draw_simple_plot(self, simple_plot, constraints):
+        """
+        Draws all of the data in a simple plot
+        """
+
         # In case this plot already had lines, we want to clear and replot
-        self._simple_plots[plots_key][plot_config.name()].clear()
-        self._simple_plots[plots_key][plot_config.name()].plot_data_and_constraints(
-            constraints=constraints
-        )
+        simple_plot.clear()
+        simple_plot.plot_data_and_constraints(constraints=constraints)
 
     def create_detailed_plots(self):
         """
@@ -183,12 +196,12 @@ def create_detailed_plots(self):
                     or plot_config.x_axis().startswith("gpu_")
                 ):
                     continue
-                self._create_update_simple_plot(
+                simple_plot = self._create_update_simple_plot(
                     plots_key=model_config_name,
                     plot_config=plot_config,
                     run_config_measurements=run_config_measurements,
-                    constraints=None,
                 )
+                self._draw_simple_plot(simple_plot, constraints=None)
 
     def export_summary_plots(self):
         """
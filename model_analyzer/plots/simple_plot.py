@@ -15,15 +15,30 @@
 # limitations under the License.
 
 import os
-from collections import defaultdict
+from functools import lru_cache
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.record.metrics_manager import MetricsManager
 from model_analyzer.reports.report_utils import truncate_model_config_name
 
 
+@lru_cache(maxsize=64)
+def _axis_header(axis):
+    """
+    Returns the label for a plot axis showing the given
+    perf_analyzer parameter or metric tag
+    """
+
+    if axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
+        return axis.replace("_", " ").title()
+    else:
+        return MetricsManager.get_metric_types([axis])[0].header(aggregation_tag="")
+
+
 class SimplePlot:
     """
     A wrapper class around a matplotlib
@@ -35,6 +50,19 @@ class SimplePlot:
     type of plot
     """
 
+    __slots__ = (
+        "_name",
+        "_title",
+        "_x_axis",
+        "_y_axis",
+        "_x_header",
+        "_y_header",
+        "_monotonic",
+        "_fig",
+        "_ax",
+        "_data",
+    )
+
     def __init__(self, name, title, x_axis, y_axis, monotonic=False):
         """
         Parameters
@@ -59,7 +87,9 @@ def __init__(self, name, title, x_axis, y_axis, monotonic=False):
         self._y_axis = y_axis
         self._monotonic = monotonic
 
-        self._fig, self._ax = plt.subplots()
+        # The figure is only created once it is drawn or saved
+        self._fig = None
+        self._ax = None
 
         self._data = {}
 
@@ -78,46 +108,42 @@ def add_run_config_measurement(self, label, run_config_measurement):
         """
 
         if label not in self._data:
-            self._data[label] = defaultdict(list)
-
-        if self._x_axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
-            self._data[label]["x_data"].append(
-                run_config_measurement.model_specific_pa_params()[0][
-                    self._x_axis.replace("_", "-")
-                ]
-            )
-        else:
-            if MetricsManager.is_gpu_metric(tag=self._x_axis):
-                self._data[label]["x_data"].append(
-                    run_config_measurement.get_gpu_metric_value(tag=self._x_axis)
-                )
-            else:
-                self._data[label]["x_data"].append(
-                    run_config_measurement.get_non_gpu_metric_value(tag=self._x_axis)
-                )
-
-        if self._y_axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
-            self._data[label]["y_data"].append(
-                run_config_measurement.model_specific_pa_params()[0][
-                    self._y_axis.replace("_", "-")
-                ]
-            )
+            self._data[label] = PlotSeries()
+
+        self._data[label].append(
+            self._get_axis_value(self._x_axis, run_config_measurement),
+            self._get_axis_value(self._y_axis, run_config_measurement),
+        )
+
+    def _get_axis_value(self, axis, run_config_measurement):
+        if axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
+            return run_config_measurement.model_specific_pa_params()[0][
+                axis.replace("_", "-")
+            ]
+        elif MetricsManager.is_gpu_metric(tag=axis):
+            return run_config_measurement.get_gpu_metric_value(tag=axis)
         else:
-            if MetricsManager.is_gpu_metric(tag=self._y_axis):
-                self._data[label]["y_data"].append(
-                    run_config_measurement.get_gpu_metric_value(tag=self._y_axis)
-                )
-            else:
-                self._data[label]["y_data"].append(
-                    run_config_measurement.get_non_gpu_metric_value(tag=self._y_axis)
-                )
+            return run_config_measurement.get_non_gpu_metric_value(tag=axis)
+
+    def _create_figure_if_needed(self):
+        """
+        Creates this plot's Figure and Axes the first time they
+        are needed. A standalone Agg Figure is used rather than pyplot,
+        so that plots are not held in pyplot's global figure registry
+        """
+
+        if self._fig is None:
+            self._fig = Figure()
+            FigureCanvasAgg(self._fig)
+            self._ax = self._fig.subplots()
 
     def clear(self):
         """
         Clear the contents of the current Axes object
         """
 
-        self._ax.clear()
+        if self._ax is not None:
+            self._ax.clear()
 
     def plot_data_and_constraints(self, constraints):
         """
@@ -132,40 +158,26 @@ def plot_data_and_constraints(self, constraints):
             values
         """
 
+        self._create_figure_if_needed()
         self._ax.set_title(self._title)
 
-        if self._x_axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
-            self._x_header = self._x_axis.replace("_", " ").title()
-        else:
-            self._x_header = MetricsManager.get_metric_types([self._x_axis])[0].header(
-                aggregation_tag=""
-            )
-
-        if self._y_axis.replace("_", "-") in PerfAnalyzerConfig.allowed_keys():
-            self._y_header = self._y_axis.replace("_", " ").title()
-        else:
-            self._y_header = MetricsManager.get_metric_types([self._y_axis])[0].header(
-                aggregation_tag=""
-            )
+        self._x_header = _axis_header(self._x_axis)
+        self._y_header = _axis_header(self._y_axis)
 
         self._ax.set_xlabel(self._x_header)
         self._ax.set_ylabel(self._y_header)
 
-        for model_config_name, data in self._data.items():
-            # Sort the data by x-axis
-            x_data, y_data = (
-                list(t) for t in zip(*sorted(zip(data["x_data"], data["y_data"])))
-            )
+        for model_config_name, series in self._data.items():
+            x_data, y_data = series.sorted_data()
 
             model_config_name = truncate_model_config_name(model_config_name)
 
             if self._monotonic:
-                filtered_x, filtered_y = [x_data[0]], [y_data[0]]
-                for i in range(1, len(x_data)):
-                    if y_data[i] > filtered_y[-1]:
-                        filtered_x.append(x_data[i])
-                        filtered_y.append(y_data[i])
-                x_data, y_data = filtered_x, filtered_y
+                # Keep the first point and every point that exceeds all before it
+                keep = np.empty(len(y_data), dtype=bool)
+                keep[0] = True
+                keep[1:] = y_data[1:] > np.maximum.accumulate(y_data)[:-1]
+                x_data, y_data = x_data[keep], y_data[keep]
 
             self._ax.plot(x_data, y_data, marker="o", label=model_config_name)
 
@@ -194,11 +206,17 @@ def data(self):
         Returns
         -------
         dict
-            keys are line labels
-            and values are lists of floats
+            keys are line labels and values are
+            dicts of x_data/y_data lists of the
+            values that were added
         """
 
-        return self._data
+        data = {}
+        for label, series in self._data.items():
+            x_data, y_data = series.data()
+            data[label] = {"x_data": x_data, "y_data": y_data}
+
+        return data
 
     def save(self, filepath):
         """
@@ -210,4 +228,52 @@ def save(self, filepath):
             this plot should be saved to
         """
 
+        self._create_figure_if_needed()
         self._fig.savefig(os.path.join(filepath, self._name))
+
+
+class PlotSeries:
+    """
+    Holds the x/y points of a single line in a SimplePlot
+
+    Points are appended to plain lists, so data() returns the values
+    with their original types (e.g. int PA parameters or a None
+    concurrency in request rate mode). They are only converted to
+    float64 numpy arrays, with None as NaN, when sorted for drawing
+    """
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(self):
+        self._x = []
+        self._y = []
+
+    def __len__(self):
+        return len(self._x)
+
+    def append(self, x, y):
+        """
+        Adds a single (x, y) point to this series
+        """
+
+        self._x.append(x)
+        self._y.append(y)
+
+    def data(self):
+        """
+        Returns the x and y values in insertion order
+        """
+
+        return list(self._x), list(self._y)
+
+    def sorted_data(self):
+        """
+        Returns the x and y values as float64 arrays
+        sorted by x (ties broken by y, NaN last)
+        """
+
+        x_data = np.array(self._x, dtype=np.float64)
+        y_data = np.array(self._y, dtype=np.float64)
+        order = np.lexsort((y_data, x_data))
+
+        return x_data[order], y_data[order]
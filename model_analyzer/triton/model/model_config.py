@@ -16,9 +16,9 @@
 
 import json
 import os
-from copy import deepcopy
+import pickle
 from shutil import copytree
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.protobuf import json_format, text_format
 from google.protobuf.descriptor import FieldDescriptor
@@ -40,7 +40,8 @@ class ModelConfig:
     A class that encapsulates all the metadata about a Triton model.
     """
 
-    _default_config_dict: Dict[str, Any] = {}
+    # Dict of {(model_repository, model_name): model_config_dict}
+    _default_config_dict: Dict[Tuple[str, str], Any] = {}
 
     def __init__(self, model_config):
         """
@@ -66,6 +67,9 @@ def create_model_config_dict(config, client, gpus, model_repository, model_name)
         If the config.pbtxt is not present, we will load a Triton Server with the
         base model and have it create a default config for MA, if possible
 
+        The result is cached per (model_repository, model_name), so repeated
+        calls for the same model do not re-parse the config or relaunch Triton
+
         Parameters:
         -----------
         config: ModelAnalyzerConfig
@@ -77,11 +81,11 @@ def create_model_config_dict(config, client, gpus, model_repository, model_name)
             name of the base model
         """
 
-        if (
-            ModelConfig._default_config_dict
-            and model_name in ModelConfig._default_config_dict
-        ):
-            return deepcopy(ModelConfig._default_config_dict[model_name])
+        cache_key = (model_repository, model_name)
+        if cache_key in ModelConfig._default_config_dict:
+            return ModelConfig.copy_config_dict(
+                ModelConfig._default_config_dict[cache_key]
+            )
 
         model_path = f"{model_repository}/{model_name}"
 
@@ -105,8 +109,18 @@ def create_model_config_dict(config, client, gpus, model_repository, model_name)
             else:
                 ModelConfig._check_default_config_exceptions(config, model_path)
 
-        ModelConfig._default_config_dict[model_name] = config
-        return deepcopy(config)
+        ModelConfig._default_config_dict[cache_key] = config
+        return ModelConfig.copy_config_dict(config)
+
+    @staticmethod
+    def copy_config_dict(config_dict: Dict) -> Dict:
+        """
+        Returns a deep copy of a model config dictionary
+
+        Model config dicts only hold plain str/number/bool/list/dict values,
+        which a pickle round trip copies several times faster than deepcopy
+        """
+        return pickle.loads(pickle.dumps(config_dict, protocol=pickle.HIGHEST_PROTOCOL))
 
     @staticmethod
     def _can_launch_mode_get_default_config_from_server(config):
@@ -237,6 +251,33 @@ def create_from_dictionary(model_dict):
 
         return ModelConfig(protobuf_message)
 
+    @staticmethod
+    def create_from_template(template, model_dict_patch):
+        """
+        Constructs a ModelConfig by copying a protobuf template and
+        applying the top-level fields of a Python dictionary on top of it
+
+        Message fields in the patch are merged into the template, while
+        repeated, map and scalar fields replace the template's value
+
+        Parameters
+        -------
+        template : protobuf message
+            The ModelConfig protobuf to start from. It is not modified.
+        model_dict_patch : dict
+            A dictionary containing the fields to set on the copy
+
+        Returns
+        -------
+        ModelConfig
+        """
+
+        protobuf_message = model_config_pb2.ModelConfig()
+        protobuf_message.CopyFrom(template)
+        json_format.ParseDict(model_dict_patch, protobuf_message)
+
+        return ModelConfig(protobuf_message)
+
     @staticmethod
     def create_from_triton_api(client, model_name, num_retries):
         """
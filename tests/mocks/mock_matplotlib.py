@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, patch
 
 from .mock_base import MockBase
 
@@ -26,9 +26,11 @@ class MockMatplotlibMethods(MockBase):
     """
 
     def __init__(self):
-        plt_attrs = {"subplots": Mock(return_value=(MagicMock(), MagicMock()))}
-        self.patcher_pyplot = patch(
-            "model_analyzer.plots.simple_plot.plt", Mock(**plt_attrs)
+        self.patcher_figure = patch(
+            "model_analyzer.plots.simple_plot.Figure", MagicMock()
+        )
+        self.patcher_canvas = patch(
+            "model_analyzer.plots.simple_plot.FigureCanvasAgg", MagicMock()
         )
         super().__init__()
         self._fill_patchers()
@@ -38,28 +40,44 @@ def start(self):
         Start mock
         """
 
-        self.pyplot_mock = self.patcher_pyplot.start()
+        self.figure_mock = self.patcher_figure.start()
+        self.patcher_canvas.start()
 
     def _fill_patchers(self):
         """
         Add patchers to list
         """
 
-        self._patchers.append(self.patcher_pyplot)
+        self._patchers.append(self.patcher_figure)
+        self._patchers.append(self.patcher_canvas)
+
+    def axes_mock(self):
+        """
+        Returns the mocked Axes that plots are drawn on
+        """
+
+        return self.figure_mock.return_value.subplots.return_value
 
     def assert_called_subplots(self):
         """
         Checks for a call to subplots
         """
 
-        self.pyplot_mock.subplots.assert_called()
+        self.figure_mock.return_value.subplots.assert_called()
+
+    def assert_not_called_subplots(self):
+        """
+        Checks that no figure/subplots have been created
+        """
+
+        self.figure_mock.assert_not_called()
 
     def assert_called_plot_with_args(self, x_data, y_data, marker, label):
         """
         Checks for call to axes.plot
         """
 
-        self.pyplot_mock.subplots.return_value[1].plot.assert_called_with(
+        self.axes_mock().plot.assert_called_with(
             x_data, y_data, marker=marker, label=label
         )
 
@@ -68,4 +86,4 @@ def assert_called_save_with_args(self, filepath):
         Checks for call to figure.savefig
         """
 
-        self.pyplot_mock.subplots.return_value[0].savefig.assert_called_with(filepath)
+        self.figure_mock.return_value.savefig.assert_called_with(filepath)
@@ -89,6 +89,8 @@ def get_test_options():
         OptionStruct("int", "profile", "--run-config-search-min-instance-count", None, "2", "1"),
         OptionStruct("int", "profile", "--run-config-search-max-instance-count", None, "10", "5"),
         OptionStruct("int", "profile", "--run-config-search-max-binary-search-steps", None, "10", "5"),
+        OptionStruct("float", "profile", "--run-config-search-saturation-threshold", None, "0.9", "0.98"),
+        OptionStruct("int", "profile", "--run-config-search-saturation-window", None, "3", "0"),
         OptionStruct("int", "profile", "--min-percentage-of-search-space", None, "10", "5"),
         OptionStruct("int", "profile", "--max-percentage-of-search-space", None, "5", "10"),
         OptionStruct("int", "profile", "--optuna-min-trials", None, "10", "20"),
@@ -1945,6 +1945,46 @@ def test_path_validation(self):
             self._evaluate_config(args, yaml_content, subcommand="profile")
         self.mock_os.set_os_path_exists_return_value(True)
 
+    def test_saturation_validation(self):
+        """
+        Test that the saturation threshold must be in (0, 1] and the
+        saturation window must not be negative
+        """
+        args = [
+            "model-analyzer",
+            "profile",
+            "--model-repository",
+            "cli_repository",
+            "-f",
+            "path-to-config-file",
+        ]
+        base_yaml_content = """
+        profile_models:
+            - model1
+        """
+
+        for yaml_option, is_valid in [
+            ("run_config_search_saturation_threshold: 1", True),
+            ("run_config_search_saturation_threshold: 0.5", True),
+            ("run_config_search_saturation_threshold: -0.5", False),
+            ("run_config_search_saturation_threshold: 1.5", False),
+            ("run_config_search_saturation_window: 0", True),
+            ("run_config_search_saturation_window: 3", True),
+            ("run_config_search_saturation_window: -1", False),
+        ]:
+            yaml_content = base_yaml_content + f"{yaml_option}\n"
+            if is_valid:
+                self._evaluate_config(args, yaml_content, subcommand="profile")
+            else:
+                with self.assertRaises(TritonModelAnalyzerException):
+                    self._evaluate_config(args, yaml_content, subcommand="profile")
+
+        # A 0 in the YAML or CLI falls back to the default value,
+        # so check that the field itself rejects it
+        config = self._evaluate_config(args, base_yaml_content, subcommand="profile")
+        with self.assertRaises(TritonModelAnalyzerException):
+            config.get_config()["run_config_search_saturation_threshold"].set_value(0)
+
     def test_copy(self):
         """
         Test that deepcopy works correctly
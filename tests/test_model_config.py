@@ -172,6 +172,7 @@ def setUp(self):
 
     def tearDown(self):
         patch.stopall()
+        ModelConfig._default_config_dict = {}
 
     def test_create_from_file(self):
         test_protobuf = self._model_config_protobuf
@@ -189,6 +190,28 @@ def test_create_from_dict(self):
         model_config.set_config(new_config)
         self.assertEqual(model_config.get_config(), new_config)
 
+    def test_create_from_template(self):
+        template = ModelConfig.create_from_dictionary(self._model_config)
+        template_proto = template._model_config
+
+        model_config = ModelConfig.create_from_template(
+            template_proto,
+            {
+                "name": "new_name",
+                "instance_group": [{"count": 2, "kind": "KIND_CPU"}],
+                "dynamic_batching": {},
+            },
+        )
+
+        expected_config = dict(self._model_config)
+        expected_config["name"] = "new_name"
+        expected_config["instance_group"] = [{"count": 2, "kind": "KIND_CPU"}]
+        expected_config["dynamic_batching"] = {}
+        self.assertEqual(model_config.get_config(), expected_config)
+
+        # The template is left untouched
+        self.assertEqual(template.get_config(), self._model_config)
+
     def test_write_config_file(self):
         model_config = ModelConfig.create_from_dictionary(self._model_config)
         model_output_path = os.path.abspath("./model_config")
@@ -471,6 +494,55 @@ def test_set_model_name(self):
         model_config.set_model_name("new_model_name")
         self.assertEqual(model_config.get_field("name"), "new_model_name")
 
+    def test_create_model_config_dict_cached(self):
+        """
+        Test that the base model config is only read once per model
+        repository/model name, and that callers get independent copies
+        """
+        mock_model_config = MockModelConfig(self._model_config_protobuf)
+        mock_model_config.start()
+
+        config = MagicMock()
+        with patch.object(
+            ModelConfig, "_create_from_file", wraps=ModelConfig._create_from_file
+        ) as mock_create_from_file:
+            first = ModelConfig.create_model_config_dict(
+                config, None, [], "/model_repo", "classification_chestxray_v1"
+            )
+            first["max_batch_size"] = 1
+            second = ModelConfig.create_model_config_dict(
+                config, None, [], "/model_repo", "classification_chestxray_v1"
+            )
+            self.assertEqual(mock_create_from_file.call_count, 1)
+            self.assertEqual(second, self._model_config)
+
+            ModelConfig.create_model_config_dict(
+                config, None, [], "/other_repo", "classification_chestxray_v1"
+            )
+            self.assertEqual(mock_create_from_file.call_count, 2)
+
+        mock_model_config.stop()
+
+    def test_copy_config_dict(self):
+        """
+        Test that copying a model config dict produces an equal dict that
+        shares no nested containers with the original
+        """
+        config_dict = {
+            "name": "model",
+            "max_batch_size": 8,
+            "instance_group": [{"count": 1, "kind": "KIND_GPU", "gpus": [0]}],
+            "dynamic_batching": {"max_queue_delay_microseconds": "100"},
+        }
+
+        config_dict_copy = ModelConfig.copy_config_dict(config_dict)
+        self.assertEqual(config_dict_copy, config_dict)
+
+        config_dict_copy["instance_group"][0]["gpus"].append(1)
+        config_dict_copy["dynamic_batching"]["preserve_ordering"] = True
+        self.assertEqual(config_dict["instance_group"][0]["gpus"], [0])
+        self.assertNotIn("preserve_ordering", config_dict["dynamic_batching"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -672,6 +672,27 @@ def test_apply_value_to_dict(self):
         )
         self.assertEqual(existing_dict, expected_dict)
 
+        # Deeply nested dicts are merged without recursion
+        depth = 2000
+        existing_dict = {}
+        input_dict = {}
+        curr_existing, curr_input = existing_dict, input_dict
+        for _ in range(depth):
+            curr_existing["x"] = {"keep": True}
+            curr_input["x"] = {}
+            curr_existing, curr_input = curr_existing["x"], curr_input["x"]
+        curr_input["new"] = 1
+
+        BaseModelConfigGenerator._apply_value_to_dict(
+            "x", input_dict["x"], existing_dict
+        )
+
+        curr_existing = existing_dict
+        for _ in range(depth):
+            curr_existing = curr_existing["x"]
+            self.assertTrue(curr_existing["keep"])
+        self.assertEqual(curr_existing["new"], 1)
+
     def test_early_exit_off_automatic_asserts(self):
         """
         Test that passing early_exit=False for automatic search raises an assert
@@ -140,6 +140,31 @@ def test_nested_dicts_different(self):
         self.assertEqual(a0, (False, "modelA_config_0"))
         self.assertEqual(a1, (False, "modelA_config_1"))
 
+    def test_nested_lists(self):
+        """
+        Test matching with model configs containing lists of dicts, and that
+        later changes to a passed in dict do not affect the stored variant
+        """
+        model_config_A_0 = {"A": [{"count": 1, "kind": "KIND_GPU"}]}
+        model_config_A_1 = {"A": [{"kind": "KIND_GPU", "count": 1}]}
+        model_config_A_2 = {"A": [{"count": 1}, {"kind": "KIND_GPU"}]}
+
+        a0 = self._mvnm.get_model_variant_name(
+            "modelA", model_config_A_0, self._non_default_param_combo
+        )
+        model_config_A_0["A"][0]["count"] = 2
+
+        a1 = self._mvnm.get_model_variant_name(
+            "modelA", model_config_A_1, self._non_default_param_combo
+        )
+        a2 = self._mvnm.get_model_variant_name(
+            "modelA", model_config_A_2, self._non_default_param_combo
+        )
+
+        self.assertEqual(a0, (False, "modelA_config_0"))
+        self.assertEqual(a1, (True, "modelA_config_0"))
+        self.assertEqual(a2, (False, "modelA_config_1"))
+
     def test_ensemble_default(self):
         """
         Test that a default ensemble config is returned
@@ -237,6 +262,9 @@ def test_from_dict(self):
         )
 
         mvnm_dict = default_encode(self._mvnm)
+        self.assertEqual(
+            set(mvnm_dict.keys()), {"_model_config_dicts", "_model_name_index"}
+        )
 
         mvnm = ModelVariantNameManager.from_dict(mvnm_dict)
 
@@ -17,6 +17,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
 from model_analyzer.plots.simple_plot import SimplePlot
 
 from .common import test_result_collector as trc
@@ -31,14 +33,17 @@ def setUp(self):
         self.matplotlib_mock.start()
 
     def test_create_plot(self):
-        # Create a plot and check for call to subplots
-        SimplePlot(
+        # Create a plot and check that the figure is only created when drawn
+        plot = SimplePlot(
             name="test_plot",
             title="test_title",
             x_axis="perf_throughput",
             y_axis="perf_latency_p99",
         )
 
+        self.matplotlib_mock.assert_not_called_subplots()
+
+        plot.plot_data_and_constraints(constraints={})
         self.matplotlib_mock.assert_called_subplots()
 
     def test_add_measurement(self):
@@ -111,6 +116,80 @@ def test_plot_data(self):
             x_data=[200], y_data=[8000], marker="o", label="test_model_label"
         )
 
+    def test_plot_data_sorted_and_monotonic(self):
+        plot = SimplePlot(
+            name="test_plot",
+            title="test_title",
+            x_axis="perf_latency_p99",
+            y_axis="perf_throughput",
+            monotonic=True,
+        )
+
+        # Points out of order, with repeated throughputs
+        points = [(x, (x * 7) % 11) for x in range(20, 0, -1)]
+        for latency, throughput in points:
+            measurement = construct_run_config_measurement(
+                model_name="test_model",
+                model_config_names=["test_model_config_0"],
+                model_specific_pa_params=MagicMock(),
+                gpu_metric_values={},
+                non_gpu_metric_values=[
+                    {"perf_throughput": throughput, "perf_latency_p99": latency}
+                ],
+                metric_objectives=[{"perf_throughput": 1}],
+            )
+            plot.add_run_config_measurement("test_model_label", measurement)
+
+        self.assertEqual(
+            plot.data()["test_model_label"]["x_data"], [x for x, _ in points]
+        )
+
+        expected_x, expected_y = [], []
+        for x, y in sorted(points):
+            if not expected_y or y > expected_y[-1]:
+                expected_x.append(x)
+                expected_y.append(y)
+
+        plot.plot_data_and_constraints(constraints={})
+        plot_args = self.matplotlib_mock.axes_mock().plot.call_args[0]
+        np.testing.assert_array_equal(plot_args[0], expected_x)
+        np.testing.assert_array_equal(plot_args[1], expected_y)
+
+    def test_plot_data_keeps_types(self):
+        """
+        Test that the plot data keeps the types of the values it was
+        given, including PA parameters that are ints or None
+        """
+        plot = SimplePlot(
+            name="test_plot",
+            title="test_title",
+            x_axis="concurrency_range",
+            y_axis="batch_size",
+        )
+
+        for batch_size in [4, 1, 2]:
+            measurement = construct_run_config_measurement(
+                model_name="test_model",
+                model_config_names=["test_model_config_0"],
+                model_specific_pa_params=[
+                    {"concurrency-range": None, "batch-size": batch_size}
+                ],
+                gpu_metric_values={},
+                non_gpu_metric_values=[{"perf_throughput": 100}],
+                metric_objectives=[{"perf_throughput": 1}],
+            )
+            plot.add_run_config_measurement("test_model_label", measurement)
+
+        data = plot.data()["test_model_label"]
+        self.assertEqual(data["x_data"], [None, None, None])
+        self.assertEqual(data["y_data"], [4, 1, 2])
+        self.assertTrue(all(type(y) is int for y in data["y_data"]))
+
+        plot.plot_data_and_constraints(constraints={})
+        plot_args = self.matplotlib_mock.axes_mock().plot.call_args[0]
+        self.assertTrue(np.isnan(plot_args[0]).all())
+        np.testing.assert_array_equal(plot_args[1], [1, 2, 4])
+
     def test_save(self):
         plot = SimplePlot(
             name="test_plot",
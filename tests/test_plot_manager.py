@@ -19,6 +19,7 @@
 from unittest.mock import MagicMock, patch
 
 from model_analyzer.plots.plot_manager import PlotManager
+from model_analyzer.plots.simple_plot import SimplePlot
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
@@ -107,6 +108,31 @@ def test_multi_model_summary_plots_against_golden(self):
 
         self.assertEqual(golden_plot_manager_dict, plot_manager_dict)
 
+    def test_summary_plots_drawn_once(self):
+        """
+        Each summary plot should only be drawn once, after all of
+        the results have been added to it
+        """
+        plot_manager = PlotManager(
+            config=self._single_model_config,
+            result_manager=self._single_model_result_manager,
+            constraint_manager=MagicMock(),
+        )
+
+        with patch.object(
+            SimplePlot, "plot_data_and_constraints", autospec=True
+        ) as mock_plot_data:
+            plot_manager.create_summary_plots()
+
+        drawn_plots = [call_args[0][0] for call_args in mock_plot_data.call_args_list]
+        all_plots = [
+            plot
+            for plot_dict in plot_manager._simple_plots.values()
+            for plot in plot_dict.values()
+        ]
+        self.assertEqual(len(drawn_plots), len(all_plots))
+        self.assertEqual(set(drawn_plots), set(all_plots))
+
     def _create_single_model_result_manager(self):
         args = [
             "model-analyzer",
@@ -187,7 +213,7 @@ def _simple_plot_to_dict(self, simple_plot):
         simple_plot_dict["_x_axis"] = simple_plot._x_axis
         simple_plot_dict["_y_axis"] = simple_plot._y_axis
         simple_plot_dict["_monotonic"] = simple_plot._monotonic
-        simple_plot_dict["_data"] = simple_plot._data
+        simple_plot_dict["_data"] = simple_plot.data()
 
         return simple_plot_dict
 
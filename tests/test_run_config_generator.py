@@ -346,6 +346,152 @@ def test_early_backoff_root_model(self):
                 yaml_str, expected_config_count=expected_num_of_configs
             )
 
+    def test_saturation_early_exit(self):
+        """
+        Test that brute search stops walking model configs once
+        run_config_search_saturation_window consecutive max_batch_size
+        sweeps fail to improve on the best throughput of the sweeps before
+
+        With a constant throughput each sweep plateaus after two
+        max_batch_size values, so without the saturation check there are
+        1 (default) + 4 instance counts * 2 = 9 configs
+
+        The first sweep sets the best throughput and every later one is
+        saturated, so a window of N stops after 1 + N sweeps
+        """
+
+        # yapf: disable
+        base_yaml_str = ("""
+            run_config_search_max_model_batch_size: 8
+            run_config_search_max_instance_count: 4
+            run_config_search_max_concurrency: 1
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        for window, expected_num_of_configs in [(0, 9), (1, 5), (2, 7), (3, 9)]:
+            yaml_str = (
+                base_yaml_str + f"run_config_search_saturation_window: {window}\n"
+            )
+            with patch.object(
+                TestRunConfigGenerator,
+                "_get_next_perf_throughput_value",
+                return_value=100,
+            ):
+                self._run_and_test_run_config_generator(
+                    yaml_str, expected_config_count=expected_num_of_configs
+                )
+
+    def test_saturation_early_exit_changing_throughput(self):
+        """
+        Test that only max_batch_size sweeps that fail to meaningfully
+        improve on the best throughput of the sweeps before them count as
+        saturated
+
+        With a window of 1 and each config 50% faster than the last, no
+        sweep is saturated and all 1 (default) + 3 instance counts * 4 = 13
+        configs are run
+
+        With each config only 0.1% faster than the last, the second sweep
+        is saturated: 1 + 2 * 4 = 9 configs
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_model_batch_size: 8
+            run_config_search_max_instance_count: 3
+            run_config_search_max_concurrency: 1
+            run_config_search_saturation_window: 1
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        for gain, expected_num_of_configs in [(1.5, 13), (1.001, 9)]:
+            with patch.object(
+                TestRunConfigGenerator,
+                "_get_next_perf_throughput_value",
+                side_effect=[100 * gain**i for i in range(13)],
+            ):
+                self._run_and_test_run_config_generator(
+                    yaml_str, expected_config_count=expected_num_of_configs
+                )
+
+    def test_saturation_early_exit_throughput_rises_again(self):
+        """
+        Test that a sweep is not saturated just because its low
+        max_batch_size configs are below the best throughput so far
+
+        Each instance count restarts max_batch_size at 1. The second sweep
+        starts below the best of the first, but ends above it, so only the
+        third sweep is saturated: 1 (default) + 3 * 4 = 13 of the 17 configs
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            run_config_search_max_model_batch_size: 8
+            run_config_search_max_instance_count: 4
+            run_config_search_max_concurrency: 1
+            run_config_search_saturation_window: 1
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        perf_throughput_values = (
+            [50]
+            + [100, 200, 300, 400]
+            + [150, 300, 450, 600]
+            + [100, 200, 300, 400]
+            + [150, 300, 450, 600]
+        )
+
+        with patch.object(
+            TestRunConfigGenerator,
+            "_get_next_perf_throughput_value",
+            side_effect=perf_throughput_values,
+        ):
+            self._run_and_test_run_config_generator(yaml_str, expected_config_count=13)
+
+    def test_saturation_early_exit_manual(self):
+        """
+        Test that saturation also stops a manual brute search, but only
+        when early_exit_enable is set
+
+        Without early exit all 1 (default) + 4 instance counts = 5 configs
+        are run. With it and a window of 1, the second sweep (of a single
+        config) is saturated: 1 + 2 = 3 configs
+        """
+
+        # yapf: disable
+        base_yaml_str = ("""
+            run_config_search_saturation_window: 1
+            profile_models:
+                my-model:
+                    parameters:
+                        concurrency: [1]
+                    model_config_parameters:
+                        instance_group:
+                        -
+                            kind: KIND_GPU
+                            count: [1,2,3,4]
+            """)
+        # yapf: enable
+
+        for early_exit_enable, expected_num_of_configs in [(False, 5), (True, 3)]:
+            yaml_str = base_yaml_str
+            if early_exit_enable:
+                yaml_str += "early_exit_enable: true\n"
+            with patch.object(
+                TestRunConfigGenerator,
+                "_get_next_perf_throughput_value",
+                return_value=100,
+            ):
+                self._run_and_test_run_config_generator(
+                    yaml_str, expected_config_count=expected_num_of_configs
+                )
+
     def test_measurement_list(self):
         """
         Test that the root model (the first one called in the recursive generator stack) gets a list